@@ -65,6 +65,13 @@ CORS_ALLOW_METHODS = [
     'PUT',
 ]
 
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'data_processor.api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
 ROOT_URLCONF = 'config.urls'
 
 TEMPLATES = [
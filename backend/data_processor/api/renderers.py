@@ -0,0 +1,65 @@
+"""
+Renderers for data processing API.
+
+Provides a JSON renderer backed by orjson, which serializes large preview
+payloads considerably faster than the standard library json module and
+handles NumPy scalars natively.
+"""
+
+import orjson
+import pandas as pd
+from rest_framework.renderers import BaseRenderer
+
+
+def default(obj):
+    """
+    Serialize values orjson does not handle natively.
+
+    pandas Timestamps (e.g. in object columns with mixed UTC offsets) are
+    rendered as ISO 8601 strings, and pd.NA and NaT as null.
+
+    Args:
+        obj: Value orjson could not serialize
+
+    Returns:
+        str or None: JSON-compatible replacement value
+
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    if isinstance(obj, pd.Timestamp):
+        return obj.isoformat()
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render response data as JSON using orjson.
+
+    NumPy scalars and arrays are serialized directly, non-string dictionary
+    keys (e.g. integer column names) are converted to strings, NaN or
+    infinite floats are rendered as null, and pandas datetime and missing
+    value scalars are handled by default().
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Serialize data to JSON bytes.
+
+        Args:
+            data: Response data to serialize
+            accepted_media_type (str): Media type accepted by the client
+            renderer_context (dict): Additional context from the view
+
+        Returns:
+            bytes: JSON-encoded data
+        """
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=default, option=self.options)
@@ -32,7 +32,7 @@ class FileProcessResponseSerializer(serializers.Serializer):
 
     Fields:
         columns (dict): Dictionary mapping column names to their data type information
-        preview_data (list): List of dictionaries containing sample rows from the data
+        preview_data (dict): Dictionary mapping column names to their sample values
     
     Example Response:
         {
@@ -48,19 +48,19 @@ class FileProcessResponseSerializer(serializers.Serializer):
                 },
                 ...
             },
-            "preview_data": [
-                {"name": "John", "age": 25, ...},
-                {"name": "Jane", "age": 30, ...},
+            "preview_data": {
+                "name": ["John", "Jane", ...],
+                "age": [25, 30, ...],
                 ...
-            ]
+            }
         }
     """
     columns = serializers.DictField(
         child=DataTypeInfoSerializer()
     )
-    preview_data = serializers.ListField(
-        child=serializers.DictField(
-            child=serializers.JSONField()
+    preview_data = serializers.DictField(
+        child=serializers.ListField(
+            child=serializers.JSONField(allow_null=True)
         )
     )
     
@@ -69,10 +69,10 @@ class FileProcessResponseSerializer(serializers.Serializer):
         Validate preview data to ensure it's not empty and has consistent structure.
 
         Args:
-            value (list): List of dictionaries containing preview data
+            value (dict): Dictionary mapping column names to lists of values
 
         Returns:
-            list: Validated preview data
+            dict: Validated preview data
 
         Raises:
             serializers.ValidationError: If data is empty or inconsistent
@@ -80,11 +80,9 @@ class FileProcessResponseSerializer(serializers.Serializer):
         if not value:
             raise serializers.ValidationError("Preview data cannot be empty")
         
-        # Check if all rows have the same columns
-        columns = set(value[0].keys())
-        for row in value[1:]:
-            if set(row.keys()) != columns:
-                raise serializers.ValidationError("Inconsistent columns in preview data")
+        # Check if all columns have the same number of rows
+        if len({len(values) for values in value.values()}) > 1:
+            raise serializers.ValidationError("Inconsistent column lengths in preview data")
         
         return value
 
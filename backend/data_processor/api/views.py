@@ -12,11 +12,59 @@ JSON responses with inferred types and data previews.
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from django.core.cache import cache
 import pandas as pd
 import numpy as np
 from ..services.infer_data_types import infer_and_convert_data_types
+from ..services.read_file import read_csv_first_block
+import hashlib
+import io
 import os
 
+# How long (in seconds) processed upload results are kept, keyed by file content
+PROCESS_FILE_CACHE_TIMEOUT = 60 * 60
+
+# Number of leading rows returned as the preview of a processed file
+PREVIEW_ROWS = 5
+
+# Dtype produced by each requested type conversion (anything else becomes object)
+CONVERTED_DTYPES = {
+    'datetime64[ns]': 'datetime64[ns]',
+    'category': 'category',
+    'int64': 'Int64',
+    'Int64': 'Int64',
+    'float64': 'float64',
+    'bool': 'boolean',
+    'boolean': 'boolean',
+}
+
+
+def df_to_json_columns(df):
+    """
+    Convert a DataFrame to a JSON-compatible mapping of column name to values.
+
+    The columnar layout avoids repeating every column name in every row and
+    lets clients send the same structure back to be loaded with a single
+    array conversion per column. Conversion is done column-wise: datetime
+    columns (naive or timezone-aware) are formatted as ISO 8601 strings that
+    keep fractional seconds and UTC offsets, infinite floats are treated as
+    missing, and every missing value becomes None.
+
+    Args:
+        df (pd.DataFrame): DataFrame to serialize
+
+    Returns:
+        dict: Dictionary mapping each column name to a list of its values
+    """
+    out = df.copy()
+    for col in out.select_dtypes(include=['datetime', 'datetimetz']).columns:
+        out[col] = out[col].map(pd.Timestamp.isoformat, na_action='ignore')
+    for col in out.select_dtypes(include='float').columns:
+        values = out[col].to_numpy(dtype='float64', na_value=np.nan)
+        out[col] = np.where(np.isfinite(values), values, np.nan)
+    return out.astype(object).where(out.notna(), None).to_dict(orient='list')
+
+
 class ProcessFileView(APIView):
     """
     API view for handling file uploads and initial data processing.
@@ -50,41 +98,34 @@ class ProcessFileView(APIView):
         if file_extension not in ['.csv', '.xlsx', '.xls']:
             return Response(
                 {'error': 'Unsupported file type. Please upload CSV or Excel files.'},
-                status=status.HTTP_400_BAD_ERROR
+                status=status.HTTP_400_BAD_REQUEST
             )
 
+        # Re-uploads of the same file skip parsing and inference entirely
+        file_bytes = file_obj.read()
+        file_hash = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+        cache_key = f'process-file:{file_extension}:{file_hash}'
+        cached_response = cache.get(cache_key)
+        if cached_response is not None:
+            return Response(cached_response, status=status.HTTP_200_OK)
+
         try:
             if file_extension == '.csv':
-                df = pd.read_csv(file_obj)
+                df = read_csv_first_block(file_bytes)
             else:
-                df = pd.read_excel(file_obj)
+                df = pd.read_excel(io.BytesIO(file_bytes), engine='calamine')
 
             processed_df = infer_and_convert_data_types(df)
 
             column_types = {col: str(dtype) for col, dtype in processed_df.dtypes.items()}
 
-            def serialize_value(val):
-                if pd.isna(val) or pd.isnull(val):
-                    return None
-                if isinstance(val, (pd.Timestamp, np.datetime64)):
-                    return val.isoformat()
-                if isinstance(val, (np.int64, np.int32)):
-                    return int(val)
-                if isinstance(val, (np.float64, np.float32)):
-                    if np.isinf(val) or np.isnan(val):
-                        return None
-                    return float(val)
-                return str(val)
-
-            preview_data = [
-                {k: serialize_value(v) for k, v in row.items()}
-                for row in processed_df.head().to_dict(orient='records')
-            ]
+            preview_data = df_to_json_columns(processed_df.iloc[:PREVIEW_ROWS])
 
             response_data = {
                 'column_types': column_types,    
                 'preview_data': preview_data     
             }
+            cache.set(cache_key, response_data, PROCESS_FILE_CACHE_TIMEOUT)
 
             return Response(response_data, status=status.HTTP_200_OK)
 
@@ -102,34 +143,13 @@ class UpdateTypesView(APIView):
     with new type conversions applied.
     """
 
-    def serialize_value(self, val):
-        """
-        Serialize values to JSON-compatible format.
-
-        Args:
-            val: Value to serialize
-
-        Returns:
-            JSON-compatible value
-        """
-        if pd.isna(val) or pd.isnull(val):
-            return None
-        if isinstance(val, (pd.Timestamp, np.datetime64)):
-            return val.isoformat()
-        if isinstance(val, (np.int64, np.int32)):
-            return int(val)
-        if isinstance(val, (np.float64, np.float32)):
-            if np.isinf(val) or np.isnan(val):
-                return None
-            return float(val)
-        return str(val)
-
     def post(self, request):
         """
         Handle data type update requests.
 
         Args:
-            request: HTTP request containing column_types and preview_data
+            request: HTTP request containing column_types and preview_data,
+                where preview_data maps each column name to a list of values
 
         Returns:
             Response: JSON response containing updated types and data preview
@@ -140,7 +160,7 @@ class UpdateTypesView(APIView):
         """
         try:
             data = request.data
-            file_data = data.get('preview_data', [])
+            file_data = data.get('preview_data', {})
             new_types = data.get('column_types', {})
 
             if not file_data or not new_types:
@@ -149,23 +169,35 @@ class UpdateTypesView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
 
+            # Columnar preview data loads with one array conversion per column
             df = pd.DataFrame(file_data)
 
+            # Conversions that are plain astype calls are collected and
+            # applied to the frame in a single call
+            batched_types = {}
+
             for column, new_type in new_types.items():
                 try:
-                    if new_type == 'datetime64[ns]':
-                        df[column] = pd.to_datetime(df[column])
-                    elif new_type == 'category':
-                        df[column] = df[column].astype('category')
-                    elif new_type == 'int64':
+                    target_dtype = CONVERTED_DTYPES.get(new_type, 'object')
+                    if str(df[column].dtype) == target_dtype:
+                        continue
+
+                    if target_dtype in ('category', 'object'):
+                        batched_types[column] = target_dtype
+                    elif new_type == 'datetime64[ns]':
+                        # Previews mix whole and fractional seconds, so the
+                        # format is not guessed from the first value
+                        try:
+                            df[column] = pd.to_datetime(df[column], format='ISO8601')
+                        except ValueError:
+                            df[column] = pd.to_datetime(df[column], format='mixed')
+                    elif target_dtype == 'Int64':
                         # Use nullable integer type instead
                         df[column] = pd.to_numeric(df[column], errors='coerce').astype('Int64')
                     elif new_type == 'float64':
                         df[column] = pd.to_numeric(df[column], errors='coerce')
-                    elif new_type == 'bool':
+                    elif target_dtype == 'boolean':
                         df[column] = df[column].astype('boolean')
-                    else:
-                        df[column] = df[column].astype('object')
                 except Exception as e:
                     return Response(
                         {
@@ -175,12 +207,26 @@ class UpdateTypesView(APIView):
                         status=status.HTTP_400_BAD_REQUEST
                     )
 
+            if batched_types:
+                try:
+                    df = df.astype(batched_types)
+                except Exception:
+                    # Cast column by column to report which one failed
+                    for column, target_dtype in batched_types.items():
+                        try:
+                            df[column] = df[column].astype(target_dtype)
+                        except Exception as e:
+                            return Response(
+                                {
+                                    'error': f'Failed to convert column "{column}" to type {new_types[column]}',
+                                    'details': str(e)
+                                },
+                                status=status.HTTP_400_BAD_REQUEST
+                            )
+
             response_data = {
                 'column_types': {col: str(dtype) for col, dtype in df.dtypes.items()},
-                'preview_data': [
-                    {col: self.serialize_value(val) for col, val in row.items()}
-                    for row in df.to_dict(orient='records')
-                ]
+                'preview_data': df_to_json_columns(df)
             }
 
             return Response(response_data)
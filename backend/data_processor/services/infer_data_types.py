@@ -18,57 +18,117 @@ The module includes special handling for:
 
 import pandas as pd
 import numpy as np
-from pandas.api.types import is_datetime64_any_dtype
-from dateutil.parser import parse
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.types import is_datetime64_any_dtype, is_numeric_dtype
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import os
 import time
 
 
-def is_date(string):
+# Strings treated as missing values in otherwise numeric columns
+_NA_TOKENS = frozenset({'Not Available', 'NA', 'N/A', 'not available', 'n/a', '', ' ', '-'})
+
+# Lowercase strings accepted as boolean values
+_BOOL_TOKENS = frozenset({'true', 'false', 't', 'f', 'yes', 'no', 'y', 'n', '1', '0'})
+
+_BOOL_MAP = {
+    'true': True, 'false': False,
+    't': True, 'f': False,
+    'yes': True, 'no': False,
+    'y': True, 'n': False,
+    '1': True, '0': False
+}
+
+# Text accepted as whole numbers and as general numbers (decimal, exponent
+# or infinity) by Arrow's string casts
+_INTEGER_PATTERN = r'^[+-]?[0-9]+$'
+_NUMBER_PATTERN = r'(?i)^[+-]?(([0-9]+\.?[0-9]*|\.[0-9]+)(e[+-]?[0-9]+)?|inf|infinity)$'
+
+# Month-name date formats, tried against the first value of a column; the
+# 'mixed' parser hands these to dateutil value by value, while numeric forms
+# like 01/31/2024 already take its fast path
+_DATE_FORMATS = ('%b %d, %Y', '%B %d, %Y', '%d %b %Y', '%d %B %Y', '%d-%b-%Y')
+
+# Number of non-null values used to rule out types before a full-column check
+_SAMPLE_SIZE = 200
+
+
+def _all_match(strings, pattern):
     """
-    Check if a string can be parsed as a date.
+    Check whether every non-null string in an Arrow array matches a pattern.
 
     Args:
-        string: Value to check for date format
+        strings (pa.Array): Arrow string array
+        pattern (str): RE2 regular expression
 
     Returns:
-        bool: True if string can be parsed as date, False otherwise
+        bool: True if all non-null values match
     """
-    try:
-        parse(str(string))
-        return True
-    except (ValueError, TypeError):
-        return False
+    return pc.all(pc.match_substring_regex(strings, pattern)).as_py() is not False
 
-def is_numeric_with_na(series):
+
+def is_numeric_with_na(series, stripped=False):
     """
     Check if a series is numeric, allowing for 'Not Available' or similar strings.
+
+    Text columns are parsed with Arrow's C++ casts, which are far faster than
+    to_numeric on strings. A failed cast still costs a full pass, so an RE2
+    pattern match over the column first decides whether a cast can succeed.
     
     Args:
         series (pd.Series): Input series to check
+        stripped (bool): Whether text values are already stripped of
+            surrounding whitespace, so the strip pass can be skipped
 
     Returns:
         tuple: (bool, pd.Series) indicating if numeric and converted series
     """
-    na_values = ['Not Available', 'NA', 'N/A', 'not available', 'n/a', '', ' ', '-']
-    temp_series = series.copy()
-    
-    temp_series = temp_series.astype(str)
-    
-    na_mask = temp_series.str.strip().isin(na_values)
-    
-    numeric_mask = ~na_mask
-    numeric_series = pd.Series(index=series.index, dtype='float64')
-    
-    try:
-        numeric_series[numeric_mask] = pd.to_numeric(temp_series[numeric_mask], errors='raise')
-        numeric_series[na_mask] = pd.NA
-        
-        non_na_mask = numeric_series.notna()
-        if non_na_mask.any() and (numeric_series[non_na_mask] % 1 == 0).all():
-            return True, pd.Series(numeric_series, dtype='Int64')  
-        return True, numeric_series
-    except (ValueError, TypeError):
-        return False, series
+    if is_numeric_dtype(series):
+        numeric_series = series
+    else:
+        text = series.astype('string[pyarrow]')
+        if not stripped:
+            text = text.str.strip()
+        strings = pa.array(text.mask(text.isin(_NA_TOKENS)))
+
+        if strings.null_count < len(strings) and _all_match(strings, _INTEGER_PATTERN):
+            try:
+                integers = pc.cast(strings, pa.int64())
+            except pa.ArrowInvalid:
+                # Outside the int64 range; parse as floats below instead
+                pass
+            else:
+                return True, pd.Series(
+                    pd.arrays.ArrowExtensionArray(integers),
+                    index=series.index,
+                    name=series.name
+                ).astype('Int64')
+
+        if not _all_match(strings, _NUMBER_PATTERN):
+            return False, series
+
+        numeric_series = pd.Series(
+            pc.cast(strings, pa.float64()).to_numpy(zero_copy_only=False),
+            index=series.index,
+            name=series.name
+        )
+
+    values = numeric_series.to_numpy(dtype='float64', na_value=np.nan)
+    values = values[~np.isnan(values)]
+    # Casting inf or out-of-range floats to int64 is platform-defined (x86
+    # wraps, aarch64 saturates), so the range is checked before the
+    # round-trip that tests the values are integral
+    is_integer = (
+        values.size
+        and np.isfinite(values).all()
+        and (np.abs(values) < 2**63).all()
+        and np.array_equal(values.astype(np.int64), values)
+    )
+    if is_integer:
+        return True, numeric_series.astype('Int64')
+    return True, numeric_series.astype('float64')
 
 def is_boolean(series):
     """
@@ -81,13 +141,18 @@ def is_boolean(series):
         bool: True if series contains boolean data, False otherwise
     """
     if series.dtype in ['int64', 'int32', 'Int64']:
-        non_na_values = series.dropna().unique()
-        return set(non_na_values).issubset({0, 1})
+        # Integers are all 0 or 1 exactly when they lie within [0, 1]
+        values = series.dropna().to_numpy(dtype='int64')
+        return values.size > 0 and bool(values.min() >= 0 and values.max() <= 1)
     
-    if series.dtype == 'object':
-        bool_values = {'true', 'false', 't', 'f', 'yes', 'no', 'y', 'n', '1', '0'}
-        non_na_values = series.dropna().astype(str).str.lower().unique()
-        return set(non_na_values).issubset(bool_values)
+    if series.dtype == 'object' or isinstance(series.dtype, pd.StringDtype):
+        # Allow a few case variants per token ('True', 'TRUE', 'true') before
+        # ruling the column out without stringifying it
+        if series.nunique(dropna=True) > 3 * len(_BOOL_TOKENS):
+            return False
+        lowered = {str(x).lower() for x in series.dropna().unique()}
+        # A column with no values at all is not evidence of booleans
+        return bool(lowered) and lowered.issubset(_BOOL_TOKENS)
     
     return False
 
@@ -95,24 +160,90 @@ def is_categorical(series, threshold=0.5):
     """
     Check if a series should be treated as categorical data.
 
+    The series is factorized once; the codes and sorted categories used for
+    the cardinality check also build the returned Categorical, so the values
+    are not hashed a second time.
+
     Args:
         series (pd.Series): Input series to check
         threshold (float): Maximum ratio of unique values to total values
 
     Returns:
-        bool: True if series should be categorical, False otherwise
+        tuple: (bool, pd.Categorical or None) indicating if categorical and converted values
     """
     if isinstance(series.dtype, pd.CategoricalDtype):
-        return True
-        
-    if series.dtype == 'object':
-        non_na_values = series.dropna().unique()
-        if len(non_na_values) <= 10 and all(len(str(x)) == 1 for x in non_na_values):
-            return True
-            
-    n_unique = len(series.dropna().unique())
-    n_total = len(series.dropna())
-    return n_total > 0 and (n_unique / n_total) < threshold and n_total >= 10
+        return True, series.array
+
+    try:
+        codes, uniques = pd.factorize(series, sort=True)
+    except TypeError:
+        # Mixed types that cannot be ordered keep their order of appearance
+        codes, uniques = pd.factorize(series)
+    n_unique = len(uniques)
+
+    def to_categorical():
+        return pd.Categorical.from_codes(codes, categories=uniques)
+
+    if series.dtype == 'object' and n_unique <= 10:
+        if all(len(str(x)) == 1 for x in uniques):
+            return True, to_categorical()
+
+    n_total = int(np.count_nonzero(codes >= 0))
+    if n_total > 0 and (n_unique / n_total) < threshold and n_total >= 10:
+        return True, to_categorical()
+    return False, None
+
+def _sniff_date_format(value):
+    """
+    Find the first of the month-name date formats that a value matches.
+
+    Args:
+        value (str): Sample value from a column
+
+    Returns:
+        str or None: Matching strptime format, or None if no format matches
+    """
+    for fmt in _DATE_FORMATS:
+        try:
+            datetime.strptime(str(value), fmt)
+        except ValueError:
+            continue
+        return fmt
+    return None
+
+def parse_dates(series):
+    """
+    Parse a string series as datetimes, if every non-null value is a date.
+
+    Each distinct string is parsed once and the results are mapped back onto
+    the rows, so columns with many repeated dates are cheap to convert. ISO
+    8601 strings, and month-name formats sniffed from the first value, go
+    through pandas' compiled parsers; the per-value dateutil-backed 'mixed'
+    parser is only used when those fail.
+
+    Args:
+        series (pd.Series): String series to parse
+
+    Returns:
+        pd.Series or None: Parsed datetime series, or None if any value is not a date
+    """
+    codes, uniques = pd.factorize(series)
+
+    parsed = pd.to_datetime(uniques, errors='coerce', format='ISO8601')
+    if parsed.isna().any():
+        fmt = _sniff_date_format(uniques[0]) if len(uniques) else None
+        if fmt is not None:
+            parsed = pd.to_datetime(uniques, errors='coerce', format=fmt)
+        if fmt is None or parsed.isna().any():
+            parsed = pd.to_datetime(uniques, errors='coerce', format='mixed', dayfirst=False)
+            if parsed.isna().any():
+                return None
+
+    return pd.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pd.NaT),
+        index=series.index,
+        name=series.name
+    )
 
 def convert_to_boolean(series):
     """
@@ -124,20 +255,12 @@ def convert_to_boolean(series):
     Returns:
         pd.Series: Converted boolean series
     """
-    bool_map = {
-        'true': True, 'false': False,
-        't': True, 'f': False,
-        'yes': True, 'no': False,
-        'y': True, 'n': False,
-        '1': True, '0': False,
-        1: True, 0: False,
-        1.0: True, 0.0: False
-    }
-    
     if series.dtype in ['int64', 'int32', 'Int64', 'float64']:
-        return series.map({1: True, 0: False}).astype('boolean')
+        # Values are 0/1 (see is_boolean), so a direct cast keeps NA and
+        # avoids building an intermediate object series through map()
+        return series.astype('boolean')
     
-    return series.map(lambda x: bool_map.get(str(x).lower()) if pd.notna(x) else None).astype('boolean')
+    return series.astype('string[pyarrow]').str.lower().map(_BOOL_MAP).astype('boolean')
 
 def infer_column_type(series):
     """
@@ -150,29 +273,52 @@ def infer_column_type(series):
         pd.Series: Series with inferred data type
     """
     if series.dtype == 'object':
-        series = series.str.strip()
+        # Object columns holding real ints, floats or bools rather than text
+        # are typed by pandas' C-level convert_dtypes with no string work
+        series = series.convert_dtypes(convert_string=False, convert_floating=False)
+
+    # Text is stripped once here; the checks below reuse the stripped series
+    is_text = series.dtype == 'object'
+    if is_text:
+        # Arrow-backed strings keep missing values as <NA> and run .str
+        # operations in contiguous C++ kernels
+        series = series.astype('string[pyarrow]').str.strip()
 
     if is_datetime64_any_dtype(series.dtype):
         return series
     
-    if series.dtype == 'bool':
+    if series.dtype in ['bool', 'boolean']:
+        return series
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
         return series
 
-    if is_boolean(series):
+    # Each check below requires every value to qualify, so a check failing
+    # on a small sample of a long text column rules out the whole column
+    # without running it over every row
+    sample = None
+    if isinstance(series.dtype, pd.StringDtype) and len(series) > _SAMPLE_SIZE:
+        sample = series.dropna().head(_SAMPLE_SIZE)
+
+    if (sample is None or is_boolean(sample)) and is_boolean(series):
         return convert_to_boolean(series)
 
-    is_numeric, numeric_series = is_numeric_with_na(series)
-    if is_numeric:
-        return numeric_series
+    if sample is None or is_numeric_with_na(sample, stripped=is_text)[0]:
+        is_numeric, numeric_series = is_numeric_with_na(series, stripped=is_text)
+        if is_numeric:
+            return numeric_series
 
-    if series.dtype == 'object' and all(is_date(x) for x in series.dropna()):
-        try:
-            return pd.to_datetime(series, format='mixed', dayfirst=False)
-        except ValueError:
-            return pd.to_datetime(series)
+    if isinstance(series.dtype, pd.StringDtype):
+        if sample is None or parse_dates(sample) is not None:
+            parsed = parse_dates(series)
+            if parsed is not None:
+                return parsed
+
+        series = series.astype('object')
 
-    if is_categorical(series):
-        return pd.Categorical(series)
+    is_category, categorical = is_categorical(series)
+    if is_category:
+        return categorical
 
     return series
 
@@ -180,6 +326,9 @@ def infer_column_type(series):
 def infer_and_convert_data_types(df):
     """
     Infer and convert data types for each column in the DataFrame.
+
+    Columns are independent, so they are inferred concurrently on a thread
+    pool; the pandas/NumPy routines doing the work release the GIL.
     
     Args:
         df (pd.DataFrame): Input DataFrame
@@ -187,12 +336,12 @@ def infer_and_convert_data_types(df):
     Returns:
         pd.DataFrame: DataFrame with inferred and converted data types
     """
-    result_df = df.copy()
-    
-    for col in df.columns:
-        if result_df[col].dtype == 'object':
-            result_df[col] = result_df[col].astype(str)
-        
-        result_df[col] = infer_column_type(result_df[col])
-    
-    return result_df
+    if len(df.columns) == 0:
+        return df.copy()
+
+    max_workers = min(len(df.columns), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        converted = list(executor.map(infer_column_type, (df[col] for col in df.columns)))
+
+    # Build the result from the converted columns rather than copying df first
+    return pd.DataFrame(dict(zip(df.columns, converted)), index=df.index)
@@ -0,0 +1,155 @@
+"""
+File reading module.
+
+This module reads uploaded CSV files into pandas DataFrames using PyArrow's
+CSV reader. It handles:
+- Reading only the first block of large files
+- Falling back to pd.read_csv for rows Arrow cannot parse
+- Naming blank and duplicate columns the way pd.read_csv does
+"""
+
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+from collections import defaultdict
+import io
+
+
+# Size in bytes of each block streamed from an uploaded CSV file
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+def dedupe_column_names(names):
+    """
+    Rename blank and duplicate column names the way pd.read_csv does.
+
+    Arrow keeps header names exactly as written, so a blank header stays ''
+    and repeated headers produce several columns with the same name. Blank
+    names become 'Unnamed: <position>' and repeats get a '.1', '.2', ...
+    suffix, so every column can be selected by name.
+
+    Args:
+        names (iterable): Column names as read from the header
+
+    Returns:
+        list: Unique column names
+    """
+    names = [
+        name if name != '' else f'Unnamed: {i}'
+        for i, name in enumerate(names)
+    ]
+    header = set(names)
+    counts = defaultdict(int)
+    for i, original in enumerate(names):
+        name = original
+        count = counts[name]
+        while count > 0:
+            counts[original] = count + 1
+            name = f'{original}.{count}'
+            # Skip suffixes already taken by a header name, as pandas does
+            count = count + 1 if name in header else counts[name]
+        names[i] = name
+        counts[name] = count + 1
+    return names
+
+
+def is_csv_parse_error(error):
+    """
+    Check whether an Arrow error comes from malformed CSV rather than types.
+
+    Arrow raises ArrowInvalid both for rows it cannot split into the header's
+    columns and for values that do not fit a column's inferred type; only the
+    message tells the two apart.
+
+    Args:
+        error (pa.ArrowInvalid): Error raised while reading a CSV file
+
+    Returns:
+        bool: True if the file could not be parsed into rows
+    """
+    return str(error).startswith('CSV parse error')
+
+
+def is_csv_conversion_error(error):
+    """
+    Check whether an Arrow error comes from a value not fitting its column type.
+
+    Args:
+        error (pa.ArrowInvalid): Error raised while reading a CSV file
+
+    Returns:
+        bool: True if a value could not be converted to the column's type
+    """
+    return 'CSV conversion error' in str(error)
+
+
+def read_csv_first_block(file_bytes):
+    """
+    Read the first block of a CSV file into a DataFrame.
+
+    Arrow parses the file one block at a time and only the first block is
+    kept. Every later block is still fully parsed (then discarded) so Arrow
+    can check it against the schema typed from the first block, and the raw
+    upload is already held in memory in full, so the only saving is the size
+    of the returned DataFrame, which is bounded by CSV_BLOCK_SIZE.
+
+    Later blocks are only checked against Arrow's physical column types
+    (integer, float, timestamp, string, ...). Types that are inferred from
+    text afterwards (booleans, dates, numbers parsed from text, categories)
+    are based on the first block alone: with 'yes'/'no' throughout the first
+    block, a column is reported as boolean even if a value like 'maybe'
+    appears further down the file. Only when a later block does not fit the
+    physical schema (e.g. text in a column that started out numeric) is the
+    whole file read into one table and returned, and memory then grows with
+    the file size.
+
+    Files Arrow cannot split into rows (e.g. short rows) are read with
+    pd.read_csv instead; other Arrow errors are raised. Column names are
+    made unique as pandas would.
+
+    Args:
+        file_bytes (bytes): Raw contents of the uploaded CSV file
+
+    Returns:
+        pd.DataFrame: Rows of the first block (or of the whole file on fallback)
+    """
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE)
+    convert_options = pa_csv.ConvertOptions(strings_can_be_null=True)
+
+    try:
+        reader = pa_csv.open_csv(
+            io.BytesIO(file_bytes),
+            read_options=read_options,
+            convert_options=convert_options
+        )
+        batches = iter(reader)
+        first_batch = next(batches, None)
+        for _ in batches:
+            pass
+        table = pa.Table.from_batches(
+            [first_batch] if first_batch is not None else [],
+            schema=reader.schema
+        )
+    except pa.ArrowInvalid as e:
+        if is_csv_parse_error(e):
+            # Arrow rejects rows with missing fields that pandas pads with NaN
+            return pd.read_csv(io.BytesIO(file_bytes))
+        if not is_csv_conversion_error(e):
+            raise
+        table = pa_csv.read_csv(
+            io.BytesIO(file_bytes),
+            read_options=read_options,
+            convert_options=convert_options
+        )
+
+    df = table.to_pandas(coerce_temporal_nanoseconds=True, date_as_object=False)
+    # Columns with no values at all are typed null by Arrow and arrive as
+    # object columns of None; pd.read_csv reads them as float64 NaN
+    null_columns = [
+        i for i, field in enumerate(table.schema) if pa.types.is_null(field.type)
+    ]
+    if null_columns:
+        df.isetitem(null_columns, df.iloc[:, null_columns].astype('float64'))
+    df.columns = dedupe_column_names(df.columns)
+    return df
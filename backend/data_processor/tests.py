@@ -1,3 +1,278 @@
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
+from django.urls import reverse
+from unittest import mock
+import pandas as pd
 
-# Create your tests here.
+from .api.renderers import ORJSONRenderer
+from .api.views import df_to_json_columns
+from .services.infer_data_types import infer_column_type, is_boolean, is_numeric_with_na
+from .services.read_file import dedupe_column_names, read_csv_first_block
+
+
+class DfToJsonColumnsTests(TestCase):
+    def test_datetimes_keep_fractional_seconds(self):
+        df = pd.DataFrame({'ts': pd.to_datetime(['2024-01-01 00:00:00.123', None])})
+        self.assertEqual(
+            df_to_json_columns(df),
+            {'ts': ['2024-01-01T00:00:00.123000', None]}
+        )
+
+    def test_timezone_aware_datetimes_keep_offset(self):
+        df = pd.DataFrame({'ts': pd.to_datetime(['2024-01-01T00:00:00+01:00'])})
+        self.assertEqual(
+            df_to_json_columns(df),
+            {'ts': ['2024-01-01T00:00:00+01:00']}
+        )
+
+
+class DedupeColumnNamesTests(TestCase):
+    def test_names_match_read_csv(self):
+        self.assertEqual(
+            dedupe_column_names(['a', '', 'a', 'a.1', 'a']),
+            ['a', 'Unnamed: 1', 'a.2', 'a.1', 'a.3']
+        )
+
+
+class ORJSONRendererTests(TestCase):
+    def test_renders_pandas_scalars(self):
+        data = {'values': [pd.Timestamp('2024-01-01T00:00:00+01:00'), pd.NaT, pd.NA]}
+        self.assertEqual(
+            ORJSONRenderer().render(data),
+            b'{"values":["2024-01-01T00:00:00+01:00",null,null]}'
+        )
+
+
+class InferColumnTypeTests(TestCase):
+    def infer(self, values):
+        return infer_column_type(pd.Series(values, dtype=object))
+
+    def test_long_numeric_text_is_numeric(self):
+        converted = self.infer([str(i) for i in range(300)])
+        self.assertEqual(str(converted.dtype), 'Int64')
+        self.assertEqual(converted.tolist(), list(range(300)))
+
+    def test_value_after_the_sample_rules_out_numeric(self):
+        values = [str(i) for i in range(300)] + ['x']
+        converted = self.infer(values)
+        self.assertEqual(str(converted.dtype), 'object')
+        self.assertEqual(converted.tolist(), values)
+
+    def test_value_after_the_sample_rules_out_boolean(self):
+        converted = self.infer(['yes', 'no'] * 150 + ['maybe'])
+        self.assertEqual(str(converted.dtype), 'category')
+
+    def test_repeated_and_missing_dates(self):
+        converted = self.infer(['2024-01-01', None, '2024-01-01', '2024-01-02'])
+        self.assertEqual(str(converted.dtype), 'datetime64[ns]')
+        self.assertEqual(
+            converted.tolist(),
+            [pd.Timestamp('2024-01-01'), pd.NaT, pd.Timestamp('2024-01-01'), pd.Timestamp('2024-01-02')]
+        )
+
+    def test_month_name_dates(self):
+        converted = self.infer(['Jan 05, 2024', 'Feb 10, 2024', None])
+        self.assertEqual(str(converted.dtype), 'datetime64[ns]')
+        self.assertEqual(
+            converted.tolist(),
+            [pd.Timestamp('2024-01-05'), pd.Timestamp('2024-02-10'), pd.NaT]
+        )
+
+    def test_month_name_dates_outside_sniffed_format_fall_back(self):
+        converted = self.infer(['Jan 05, 2024', '10 February 2024'])
+        self.assertEqual(str(converted.dtype), 'datetime64[ns]')
+        self.assertEqual(
+            converted.tolist(),
+            [pd.Timestamp('2024-01-05'), pd.Timestamp('2024-02-10')]
+        )
+
+    def test_month_name_column_with_non_date_stays_text(self):
+        converted = self.infer(['Jan 05, 2024', 'not a date'])
+        self.assertEqual(str(converted.dtype), 'object')
+
+    def test_categorical_has_sorted_categories_and_missing_values(self):
+        values = ['pear', 'apple', None, 'pear', 'apple'] * 4
+        converted = self.infer(values)
+        expected = pd.Categorical(values)
+        self.assertIsInstance(converted.dtype, pd.CategoricalDtype)
+        self.assertEqual(converted.categories.tolist(), ['apple', 'pear'])
+        self.assertEqual(converted.codes.tolist(), expected.codes.tolist())
+        self.assertEqual(converted.codes.tolist()[:5], [1, 0, -1, 1, 0])
+
+
+class IsBooleanTests(TestCase):
+    def test_columns_without_values_are_not_boolean(self):
+        for series in [
+            pd.Series([None, None], dtype=object),
+            pd.Series([pd.NA, pd.NA], dtype='string[pyarrow]'),
+            pd.Series([pd.NA, pd.NA], dtype='Int64'),
+        ]:
+            with self.subTest(dtype=str(series.dtype)):
+                self.assertFalse(is_boolean(series))
+
+
+class IsNumericWithNaTests(TestCase):
+    def check(self, values):
+        return is_numeric_with_na(pd.Series(values, dtype=object))
+
+    def test_integers_with_na_tokens_and_signs(self):
+        is_numeric, converted = self.check(['1', 'N/A', '-2', '+3', 'Not Available', ' 4 '])
+        self.assertTrue(is_numeric)
+        self.assertEqual(str(converted.dtype), 'Int64')
+        self.assertEqual(converted.tolist(), [1, pd.NA, -2, 3, pd.NA, 4])
+
+    def test_decimals_exponents_and_infinity(self):
+        is_numeric, converted = self.check(['1.5', '-2e3', '+.5', 'inf', '-Infinity', '-'])
+        self.assertTrue(is_numeric)
+        self.assertEqual(str(converted.dtype), 'float64')
+        self.assertEqual(converted.tolist()[:5], [1.5, -2000.0, 0.5, float('inf'), float('-inf')])
+        self.assertTrue(pd.isna(converted.iloc[5]))
+
+    def test_rejects_non_decimal_text(self):
+        for value in ['nan', '1,000', '0x10']:
+            with self.subTest(value=value):
+                is_numeric, converted = self.check([value, '1'])
+                self.assertFalse(is_numeric)
+                self.assertEqual(converted.tolist(), [value, '1'])
+
+    def test_int64_bounds_stay_integer(self):
+        is_numeric, converted = self.check(['9223372036854775807', '-9223372036854775808'])
+        self.assertTrue(is_numeric)
+        self.assertEqual(str(converted.dtype), 'Int64')
+
+    def test_int64_overflow_falls_back_to_float(self):
+        is_numeric, converted = self.check(['9223372036854775808', '1'])
+        self.assertTrue(is_numeric)
+        self.assertEqual(str(converted.dtype), 'float64')
+        self.assertEqual(converted.tolist(), [2.0**63, 1.0])
+
+    def test_floats_outside_int64_range_stay_float(self):
+        is_numeric, converted = is_numeric_with_na(pd.Series([2.0**63, 1.0]))
+        self.assertTrue(is_numeric)
+        self.assertEqual(str(converted.dtype), 'float64')
+
+
+@mock.patch('data_processor.services.read_file.CSV_BLOCK_SIZE', 64)
+class ReadCsvFirstBlockTests(TestCase):
+    def test_reads_only_first_block(self):
+        df = read_csv_first_block(b'a\n' + b'1\n' * 100)
+        self.assertLess(len(df), 100)
+        self.assertEqual(str(df['a'].dtype), 'int64')
+
+    def test_type_mismatch_in_later_block_reads_whole_file(self):
+        df = read_csv_first_block(b'a\n' + b'1\n' * 100 + b'x\n')
+        self.assertEqual(len(df), 101)
+        self.assertEqual(df['a'].iloc[-1], 'x')
+
+
+class ProcessFileViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def upload(self, content, name='data.csv'):
+        return self.client.post(
+            reverse('process-file'),
+            {'file': SimpleUploadedFile(name, content)}
+        )
+
+    def test_duplicate_headers_are_renamed(self):
+        response = self.upload(b'a,a\n1,2\n')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.json()['column_types']), ['a', 'a.1'])
+
+    def test_blank_header_is_named_by_position(self):
+        response = self.upload(b',b\n1,2\n')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.json()['column_types']), ['Unnamed: 0', 'b'])
+
+    def test_short_rows_are_padded_with_missing_values(self):
+        response = self.upload(b'a,b\n1,2\n3\n')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['preview_data'], {'a': [1, 3], 'b': [2, None]})
+
+    def test_empty_columns_are_float(self):
+        response = self.upload(b'a,b,c\n1,,N/A\n2,,NA\n')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['column_types'],
+            {'a': 'Int64', 'b': 'float64', 'c': 'float64'}
+        )
+
+    def test_timezone_aware_timestamps(self):
+        response = self.upload(b'ts,x\n2024-01-01T00:00:00Z,1\n')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['preview_data']['ts'], ['2024-01-01T00:00:00+00:00'])
+
+    def test_dates_with_mixed_offsets(self):
+        response = self.upload(b'ts\n2024-03-30 00:00:00 +01:00\n2024-04-01 00:00:00 +02:00\n')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()['preview_data']['ts'],
+            ['2024-03-30T00:00:00+01:00', '2024-04-01T00:00:00+02:00']
+        )
+
+
+class UpdateTypesViewTests(TestCase):
+    def update(self, column_types, preview_data):
+        return self.client.post(
+            reverse('update-types'),
+            {'column_types': column_types, 'preview_data': preview_data},
+            content_type='application/json'
+        )
+
+    def test_datetime_with_offset(self):
+        response = self.update(
+            {'c': 'datetime64[ns]'},
+            {'c': ['2024-01-01T00:00:00+01:00']}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['preview_data'], {'c': ['2024-01-01T00:00:00+01:00']})
+
+    def test_datetime_with_mixed_offsets(self):
+        values = ['2024-03-30T00:00:00+01:00', '2024-04-01T00:00:00+02:00']
+        response = self.update({'c': 'datetime64[ns]'}, {'c': values})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['preview_data'], {'c': values})
+
+    def test_failed_category_cast_names_column(self):
+        response = self.update({'a': 'category'}, {'a': [[1], [2]]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['error'], 'Failed to convert column "a" to type category')
+
+    def test_boolean_dtype_name_is_kept(self):
+        response = self.update({'b': 'boolean'}, {'b': [True, None]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['column_types'], {'b': 'boolean'})
+
+
+class PreviewRoundTripTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_update_types_accepts_process_file_preview(self):
+        content = (
+            b'id,price,flag,when,name\n'
+            b'1,1.5,yes,2024-01-01 10:00:00,a\n'
+            b'2,N/A,no,2024-01-01 11:00:00.5,b\n'
+            b'3,2.25,yes,,c\n'
+        )
+        processed = self.client.post(
+            reverse('process-file'),
+            {'file': SimpleUploadedFile('data.csv', content)}
+        ).json()
+        self.assertEqual(processed['preview_data'], {
+            'id': [1, 2, 3],
+            'price': [1.5, None, 2.25],
+            'flag': [True, False, True],
+            'when': ['2024-01-01T10:00:00', '2024-01-01T11:00:00.500000', None],
+            'name': ['a', 'b', 'c'],
+        })
+
+        updated = self.client.post(
+            reverse('update-types'),
+            processed,
+            content_type='application/json'
+        )
+        self.assertEqual(updated.status_code, 200)
+        self.assertEqual(updated.json(), processed)
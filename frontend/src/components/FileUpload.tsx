@@ -126,6 +126,9 @@ const FileUpload = () => {
     return DATA_TYPES.find(t => t.value === type)?.label || type;
   };
 
+  const previewColumns = data ? Object.keys(data.preview_data) : [];
+  const previewRowCount = data && previewColumns.length ? data.preview_data[previewColumns[0]].length : 0;
+
   return (
     <div style={{ position: 'relative' }}>
       <LoadingOverlay visible={isLoading || isApplying} overlayProps={{ blur: 2 }} />
@@ -220,19 +223,22 @@ const FileUpload = () => {
           <Table striped highlightOnHover withTableBorder>
             <Table.Thead>
               <Table.Tr>
-                {Object.keys(data.preview_data[0] || {}).map((header) => (
+                {previewColumns.map((header) => (
                   <Table.Th key={header}>{header}</Table.Th>
                 ))}
               </Table.Tr>
             </Table.Thead>
             <Table.Tbody>
-              {data.preview_data.map((row, index) => (
+              {Array.from({ length: previewRowCount }, (_, index) => (
                 <Table.Tr key={index}>
-                  {Object.values(row).map((value, cellIndex) => (
-                    <Table.Td key={cellIndex}>
-                      {value === null ? 'NULL' : String(value)}
-                    </Table.Td>
-                  ))}
+                  {previewColumns.map((column, cellIndex) => {
+                    const value = data.preview_data[column][index];
+                    return (
+                      <Table.Td key={cellIndex}>
+                        {value === null ? 'NULL' : String(value)}
+                      </Table.Td>
+                    );
+                  })}
                 </Table.Tr>
               ))}
             </Table.Tbody>
@@ -54,11 +54,11 @@ export const uploadFile = async (file: File): Promise<ApiResponse> => {
  * Updates data types for specified columns
  * 
  * @param columnTypes - Object mapping column names to their new types
- * @param previewData - Current preview data to update
+ * @param previewData - Current preview data to update, mapping each column to its values
  * @returns Promise with the API response containing updated types and preview data
  * @throws Error if type update fails
  */
-export const updateTypes = async (columnTypes: {[key: string]: string}, previewData: any[]): Promise<ApiResponse> => {
+export const updateTypes = async (columnTypes: {[key: string]: string}, previewData: Record<string, any[]>): Promise<ApiResponse> => {
   try {
       const response = await axios.post(`${API_BASE_URL}/update-types/`, {  
           column_types: columnTypes,
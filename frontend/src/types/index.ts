@@ -9,10 +9,12 @@
 
 /**
  * Represents the structure of column types and preview data
+ * 
+ * Preview data is columnar: each column name maps to its list of values.
  */
 export interface ColumnType {
     column_types: { [key: string]: string };
-    preview_data: Record<string, any>[];
+    preview_data: Record<string, any[]>;
   }
   
 /**